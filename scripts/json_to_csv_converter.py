@@ -1,9 +1,78 @@
 import json
 import csv
+import os
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from collections import deque
+from itertools import chain
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+# Mapeamento de meses em português para números
+_MONTH_MAPPING = MappingProxyType({
+    'jan': '01', 'fev': '02', 'mar': '03', 'abr': '04',
+    'mai': '05', 'jun': '06', 'jul': '07', 'ago': '08',
+    'set': '09', 'out': '10', 'nov': '11', 'dez': '12'
+})
+
+# Padrões regex para extração (compilados uma única vez na importação)
+_TIME_PATTERN = re.compile(r'\b([0-9]?[0-9])[:°]([0-5][0-9])\b')
+_DATE_PATTERN = re.compile(r'(\d{1,2})\s+(\w{3,4})\s+(\d{4})')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_FILE_INDEX_PATTERN = re.compile(r'(\d{3})')
+
+# Valores com R$ explícito, todas as variantes em uma única alternância (uma varredura do texto)
+_R_DOLLAR_VALUE_PATTERN = re.compile(
+    r'R\$\s*(\d{1,4})[.,](\d{2})'      # R$ 16,37, R$ 16.37 ou R$16,37 (sem espaço)
+    r'|R\$\.(\d{1,4})[.,](\d{2})'      # R$.16,37
+    r'|R\$\s*(\d{1,4})\s+(\d{2})',     # R$16 37 (espaço no lugar da vírgula)
+    re.IGNORECASE
+)
+_R_DOLLAR_PREFIX_PATTERN = re.compile(r'R\$[:\s\.]*')
+_R_DOLLAR_FALLBACK_PATTERN = re.compile(r'R\$[:\s]*', re.IGNORECASE)
+
+# Valores sem R$ (vírgula ou ponto decimal)
+_COMMA_DECIMAL_PATTERN = re.compile(r'\b(\d{1,4}),(\d{2})\b')
+_DOT_DECIMAL_PATTERN = re.compile(r'\b(\d{1,4})\.(\d{2})\b')
+
+
+class TransactionRow(NamedTuple):
+    """Linha do CSV consolidado (mesma ordem das colunas do arquivo)"""
+    data: str
+    hora: str
+    valor: Union[float, str]  # float ou "Não encontrado"
+    tipo_de_venda: str
+    arquivo_de_referencia: str
+
+
+class _TransactionStats:
+    """Estatísticas das transações, acumuladas linha a linha (uma única passagem)"""
+    
+    def __init__(self):
+        self.total_transactions = 0
+        self.total_value = 0
+        self.valid_values_count = 0
+        self.days_count = {}
+        self.days_total = {}
+    
+    def add(self, transaction: TransactionRow) -> None:
+        day = transaction.data
+        self.total_transactions += 1
+        self.days_count[day] = self.days_count.get(day, 0) + 1
+        
+        # Soma apenas valores numéricos
+        if isinstance(transaction.valor, (int, float)):
+            self.total_value += transaction.valor
+            self.valid_values_count += 1
+            self.days_total[day] = self.days_total.get(day, 0) + transaction.valor
+    
+    def track(self, transactions: Iterable[TransactionRow]) -> Iterator[TransactionRow]:
+        """Repassa as transações, acumulando as estatísticas de cada uma no caminho"""
+        for transaction in transactions:
+            self.add(transaction)
+            yield transaction
 
 
 class JSONToCSVConverter:
@@ -15,17 +84,6 @@ class JSONToCSVConverter:
         
         # Cria pasta de saída se não existir
         self.output_folder.mkdir(exist_ok=True)
-        
-        # Mapeamento de meses em português para números
-        self.month_mapping = {
-            'jan': '01', 'fev': '02', 'mar': '03', 'abr': '04',
-            'mai': '05', 'jun': '06', 'jul': '07', 'ago': '08',
-            'set': '09', 'out': '10', 'nov': '11', 'dez': '12'
-        }
-        
-        # Padrões regex para extração
-        self.time_pattern = r'\b([0-9]?[0-9])[:°]([0-5][0-9])\b'
-        self.value_pattern = r'R\$\s*([0-9]+[.,]?[0-9]*)'
     
     def convert_date_format(self, date_string: list) -> str:
         """
@@ -39,11 +97,11 @@ class JSONToCSVConverter:
             return "Não encontrado"
         
         # Remove pontos e normaliza espaços
-        normalized = re.sub(r'\.', '', date_string_match.strip())
-        normalized = re.sub(r'\s+', ' ', normalized)
+        normalized = date_string_match.strip().replace('.', '')
+        normalized = _WHITESPACE_PATTERN.sub(' ', normalized)
         
         # Padrão: dia mês ano (ex: "29 set 2025")
-        match = re.match(r'(\d{1,2})\s+(\w{3,4})\s+(\d{4})', normalized)
+        match = _DATE_PATTERN.match(normalized)
         
         if match:
             day = match.group(1).zfill(2)  # Adiciona zero à esquerda se necessário
@@ -51,7 +109,7 @@ class JSONToCSVConverter:
             year = match.group(3)
             
             # Converte mês abreviado para número
-            month_num = self.month_mapping.get(month_abbr, '01')
+            month_num = _MONTH_MAPPING.get(month_abbr, '01')
             
             return f"{day}/{month_num}/{year}"
         
@@ -64,11 +122,11 @@ class JSONToCSVConverter:
         if not text:
             return "Não encontrado"
         
-        matches = re.findall(self.time_pattern, text)
+        match = _TIME_PATTERN.search(text)
         
-        if matches:
+        if match:
             # Pega o primeiro horário encontrado
-            hour, minute = matches[0]
+            hour, minute = match.groups()
             
             # Verifica e ajusta se o primeiro número da hora é 7 ou 9
             if hour.startswith('7') or hour.startswith('9'):
@@ -94,33 +152,21 @@ class JSONToCSVConverter:
             return "Não encontrado"
         
         # Estratégia 1: Busca valores com R$ explícito (mais seguro)
-        r_dollar_patterns = [
-            r'R\$\s*(\d{1,4})[.,](\d{2})',     # R$ 16,37 ou R$ 16.37
-            r'R\$\.(\d{1,4})[.,](\d{2})',      # R$.16,37
-            r'R\$(\d{1,4})[.,](\d{2})',        # R$16,37 (sem espaço)
-            r'R\$\s*(\d{1,4})\s+(\d{2})',      # R$16 37 (espaço no lugar da vírgula)
-        ]
-        
         found_values = []
         
-        for pattern in r_dollar_patterns:
-            matches = re.findall(pattern, value_string, re.IGNORECASE)
-            for match in matches:
-                try:
-                    if isinstance(match, tuple) and len(match) >= 2:
-                        # Reconstrói o número (parte inteira, parte decimal)
-                        value = float(f"{match[0]}.{match[1]}")
-                        found_values.append(value)
-                except (ValueError, IndexError):
-                    continue
+        for match in _R_DOLLAR_VALUE_PATTERN.finditer(value_string):
+            # Apenas os grupos da alternativa que casou estão preenchidos
+            integer_part, decimal_part = [group for group in match.groups() if group is not None]
+            # Reconstrói o número (parte inteira, parte decimal)
+            found_values.append(float(f"{integer_part}.{decimal_part}"))
         
         # Estratégia 2: Busca padrões monetários sem R$ (mais restritiva para evitar horários)
         if not found_values:
             # Remove R$ e caracteres especiais, mas preserva contexto
-            cleaned = re.sub(r'R\$[:\s\.]*', '', value_string)
+            cleaned = _R_DOLLAR_PREFIX_PATTERN.sub('', value_string)
             
             # Busca números com vírgula decimal (formato brasileiro) - menos provável de ser horário
-            comma_decimal_matches = re.findall(r'\b(\d{1,4}),(\d{2})\b', cleaned)
+            comma_decimal_matches = _COMMA_DECIMAL_PATTERN.findall(cleaned)
             for match in comma_decimal_matches:
                 try:
                     value = float(f"{match[0]}.{match[1]}")
@@ -135,7 +181,7 @@ class JSONToCSVConverter:
             
             # Busca números com ponto decimal (menos comum em horários brasileiros)
             if not found_values:
-                dot_decimal_matches = re.findall(r'\b(\d{1,4})\.(\d{2})\b', cleaned)
+                dot_decimal_matches = _DOT_DECIMAL_PATTERN.findall(cleaned)
                 for match in dot_decimal_matches:
                     try:
                         value = float(f"{match[0]}.{match[1]}")
@@ -163,7 +209,7 @@ class JSONToCSVConverter:
         try:
             # Apenas se tem R$ explícito
             if 'R$' in value_string.upper():
-                cleaned = re.sub(r'R\$[:\s]*', '', value_string, flags=re.IGNORECASE)
+                cleaned = _R_DOLLAR_FALLBACK_PATTERN.sub('', value_string)
                 cleaned = cleaned.strip().replace(',', '.')
                 value = float(cleaned)
                 return value
@@ -194,7 +240,7 @@ class JSONToCSVConverter:
         day_folder_name = Path(day_folder).stem  # Obtém o nome do arquivo sem extensão
         return f"{day_folder_name}_quadrante_{quadrant_number:02d}"
     
-    def process_single_json(self, json_file_path: Path) -> List[Dict]:
+    def process_single_json(self, json_file_path: Path) -> List[TransactionRow]:
         """
         Processa um único arquivo JSON e extrai transações
         """
@@ -255,13 +301,13 @@ class JSONToCSVConverter:
                 reference_file = self.extract_reference_filename(json_file_path, quadrant_num)
                 
                 # Adiciona transação válida
-                transaction_row = {
-                    'Data': formatted_date,
-                    'Hora': time_str,
-                    'Valor': value_float,
-                    'Tipo de Venda': 'Débito',
-                    'arquivo_de_referencia': reference_file
-                }
+                transaction_row = TransactionRow(
+                    data=formatted_date,
+                    hora=time_str,
+                    valor=value_float,
+                    tipo_de_venda='Débito',
+                    arquivo_de_referencia=reference_file
+                )
                 
                 transactions_data.append(transaction_row)
             
@@ -279,20 +325,27 @@ class JSONToCSVConverter:
         if not self.json_folder.exists():
             raise FileNotFoundError(f"Pasta não encontrada: {self.json_folder}")
         
-        json_files = list(self.json_folder.glob("*_data.json"))
+        # Uma única varredura do diretório, filtrando pelo sufixo do nome
+        with os.scandir(self.json_folder) as entries:
+            json_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith("_data.json") and entry.is_file()
+            ]
         
         # Ordena por índice no formato '001', '002', etc.
         def extract_index(file_path):
-            match = re.search(r'(\d{3})', file_path.name)
+            match = _FILE_INDEX_PATTERN.search(file_path.name)
             return int(match.group(1)) if match else 0
         
         json_files.sort(key=extract_index)
         
         return json_files
     
-    def process_all_json_files(self) -> List[Dict]:
+    def process_all_json_files(self) -> Iterator[TransactionRow]:
         """
         Processa todos os arquivos JSON e consolida transações
+        Gerador: as transações de cada arquivo são entregues à medida que ele é lido,
+        sem manter a lista completa em memória
         """
         print("🔄 Iniciando conversão JSON → CSV")
         print("=" * 50)
@@ -301,25 +354,27 @@ class JSONToCSVConverter:
         
         if not json_files:
             print("❌ Nenhum arquivo JSON encontrado!")
-            return []
+            return
         
         print(f"📁 Encontrados {len(json_files)} arquivos JSON")
         
-        all_transactions = []
-        
+        total_transactions = 0
         for json_file in json_files:
             transactions = self.process_single_json(json_file)
-            all_transactions.extend(transactions)
+            total_transactions += len(transactions)
+            yield from transactions
         
-        print(f"\n📊 Total de transações válidas: {len(all_transactions)}")
-        
-        return all_transactions
+        print(f"\n📊 Total de transações válidas: {total_transactions}")
     
-    def generate_csv(self, transactions: List[Dict], filename: str = "transacoes_consolidadas.csv") -> Path:
+    def generate_csv(self, transactions: Iterable[TransactionRow], filename: str = "transacoes_consolidadas.csv") -> Path:
         """
         Gera arquivo CSV com as transações
+        Aceita qualquer iterável (inclusive geradores); as linhas são escritas à medida que chegam
         """
-        if not transactions:
+        transactions = iter(transactions)
+        first_transaction = next(transactions, None)
+        
+        if first_transaction is None:
             print("❌ Nenhuma transação para exportar!")
             return None
         
@@ -334,21 +389,24 @@ class JSONToCSVConverter:
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Cabeçalhos do CSV
-        fieldnames = ['Data', 'Hora', 'Valor', 'Tipo de Venda', 'arquivo_de_referencia']
+        fieldnames = ('Data', 'Hora', 'Valor', 'Tipo de Venda', 'arquivo_de_referencia')
         
         try:
             with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames, delimiter=';')
+                # csv.writer com tuplas evita a montagem de lista por campo do DictWriter
+                writer = csv.writer(csvfile, delimiter=';')
                 
                 # Escreve cabeçalho
-                writer.writeheader()
+                writer.writerow(fieldnames)
                 
-                # Escreve transações
-                for transaction in transactions:
+                # Escreve transações (cada TransactionRow já é a tupla da linha)
+                total_rows = 0
+                for transaction in chain((first_transaction,), transactions):
                     writer.writerow(transaction)
+                    total_rows += 1
             
             print(f"✅ CSV gerado com sucesso: {output_file}")
-            print(f"📊 Total de linhas: {len(transactions) + 1} (incluindo cabeçalho)")
+            print(f"📊 Total de linhas: {total_rows + 1} (incluindo cabeçalho)")
             
             return output_file
             
@@ -356,25 +414,29 @@ class JSONToCSVConverter:
             print(f"❌ Erro ao gerar CSV: {str(e)}")
             return None
     
-    def generate_statistics_report(self, transactions: List[Dict]) -> None:
+    def generate_statistics_report(self, transactions: Iterable[TransactionRow]) -> None:
         """
         Gera relatório estatístico das transações
+        Todas as estatísticas são acumuladas em uma única passagem pelas transações
         """
-        if not transactions:
-            return
+        stats = _TransactionStats()
+        for transaction in transactions:
+            stats.add(transaction)
         
-        # Estatísticas básicas
-        total_transactions = len(transactions)
-        # Calcula total apenas para valores numéricos
-        valid_values = [t['Valor'] for t in transactions if isinstance(t['Valor'], (int, float))]
-        total_value = sum(valid_values)
-        avg_value = total_value / len(valid_values) if valid_values else 0
+        self._write_statistics_report(stats)
+    
+    def _write_statistics_report(self, stats: _TransactionStats) -> None:
+        """
+        Grava o relatório estatístico a partir das estatísticas já acumuladas
+        """
+        if not stats.total_transactions:
+            return
         
-        # Transações por dia
-        days_count = {}
-        for transaction in transactions:
-            day = transaction['Data']
-            days_count[day] = days_count.get(day, 0) + 1
+        total_transactions = stats.total_transactions
+        total_value = stats.total_value
+        days_count = stats.days_count
+        days_total = stats.days_total
+        avg_value = total_value / stats.valid_values_count if stats.valid_values_count else 0
         
         # Extrai o mês e o tipo da pasta json_folder
         month = self.json_folder.parts[-2]  # Penúltima parte do caminho
@@ -399,9 +461,7 @@ class JSONToCSVConverter:
             
             f.write("📅 TRANSAÇÕES POR DIA:\n")
             for day, count in sorted(days_count.items()):
-                # Calcula total apenas para valores numéricos deste dia
-                day_values = [t['Valor'] for t in transactions if t['Data'] == day and isinstance(t['Valor'], (int, float))]
-                day_total = sum(day_values)
+                day_total = days_total.get(day, 0)
                 f.write(f"   {day}: {count} transações - R$ {day_total:.2f}\n")
         
         print(f"📈 Relatório estatístico salvo: {report_file}")
@@ -410,17 +470,24 @@ class JSONToCSVConverter:
         """
         Método principal para conversão completa
         """
-        # Processa todos os JSONs
-        transactions = self.process_all_json_files()
+        # Processa todos os JSONs em fluxo: cada transação é gravada no CSV e
+        # contabilizada nas estatísticas na mesma passagem
+        stats = _TransactionStats()
+        transactions = stats.track(self.process_all_json_files())
         
-        if not transactions:
+        first_transaction = next(transactions, None)
+        if first_transaction is None:
             return None
         
         # Gera CSV
-        csv_file = self.generate_csv(transactions, output_filename)
+        csv_file = self.generate_csv(chain((first_transaction,), transactions), output_filename)
+        
+        # Se a gravação do CSV falhou no meio, as transações restantes ainda
+        # entram nas estatísticas
+        deque(transactions, maxlen=0)
         
         # Gera relatório estatístico
-        self.generate_statistics_report(transactions)
+        self._write_statistics_report(stats)
         
         return csv_file
 
@@ -445,7 +512,7 @@ def preview_conversion_data(json_folder, max_files=3):
         transactions = converter.process_single_json(json_file)
         
         for j, transaction in enumerate(transactions[:3]):  # Mostra apenas 3 primeiras
-            print(f"   {j+1}. {transaction['Data']} | {transaction['Hora']} | R$ {transaction['Valor']:.2f} | {transaction['arquivo_de_referencia']}")
+            print(f"   {j+1}. {transaction.data} | {transaction.hora} | R$ {transaction.valor:.2f} | {transaction.arquivo_de_referencia}")
         
         if len(transactions) > 3:
             print(f"   ... e mais {len(transactions) - 3} transações")
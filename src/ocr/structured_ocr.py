@@ -1,17 +1,368 @@
 import cv2
+import numpy as np
 from PIL import Image
 import pytesseract
 from pathlib import Path
 import json
+import hashlib
 import re
 import os
+import tempfile
+import threading
+import atexit
+import multiprocessing
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import List, Optional
+from collections import Counter
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+# Cada chamada do Tesseract roda em uma thread própria; o OpenMP interno
+# multiplicaria as threads além do número de núcleos
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+try:
+    import tesserocr  # Opcional: mantém o Tesseract carregado em memória entre chamadas
+except ImportError:
+    tesserocr = None
+
+try:
+    import xxhash  # Opcional: hash do conteúdo das imagens bem mais rápido que o sha256
+except ImportError:
+    xxhash = None
+
+# Nomes de meses e tipos de transação reconhecidos no caminho das pastas
+_MESES = frozenset([
+    'janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
+    'julho', 'agosto', 'setembro', 'outubro', 'novembro', 'dezembro',
+])
+_MESES_ABREV = frozenset([
+    'jan', 'fev', 'mar', 'abr', 'mai', 'jun',
+    'jul', 'ago', 'set', 'out', 'nov', 'dez',
+])
+_TIPOS_TRANSACAO = frozenset(['debito', 'credito', 'pix', 'debit', 'credit'])
+
+# Buffer dos arquivos de saída (o padrão de 8 KiB gera muitas chamadas de escrita)
+_WRITE_BUFFER_SIZE = 256 * 1024
+
+# Extensões de imagem dos quadrantes, na ordem de prioridade para desempate
+_IMAGE_EXTENSIONS = {'.jpg': 0, '.jpeg': 1, '.png': 2, '.bmp': 3, '.tiff': 4}
+
+# Padrões agressivos de valores, usados quando os padrões normais não encontram nada
+_AGGRESSIVE_AMOUNT_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r'R\$\s*\d+[.,]\d{2}',           # R$ 22,00 ou R$ 22.00
+    r'R\$\s*\d+',                    # R$ 22
+    r'RS\s*\d+[.,]\d{2}',           # RS 22,00 (erro comum OCR)
+    r'R\$\.?\s*\d+[.,]?\d*',        # R$.22,00 ou R$. 22
+    r'Pix.*?R\$\s*[\d.,]+',         # Pix ... R$ 22,00
+    r'(?:Pix|Dix).*?(\d+[.,]\d{2})', # Pix/Dix ... 22,00
+    r'(\d+[.,]\d{2}).*?(?:Pix|Dix)', # 22,00 ... Pix/Dix
+    r'(\d{1,3}[.,]\d{2})\s*(?=\s|$|Processando)', # Valor antes de "Processando"
+    # Busca valores isolados que possam ter sido separados
+    r'(?<!\d)(\d{1,3}[.,]\d{2})(?!\d)',  # Valores isolados
+    r'(?<!\d)(\d{1,2},\d{2})(?!\d)',     # 16,00 isolado
+    r'(?<!\d)(\d{1,2}\.\d{2})(?!\d)',    # 16.00 isolado
+])
+
+# Sequências numéricas que possam ser valores (último recurso)
+_NUMBER_PATTERNS = (
+    re.compile(r'(\d{1,3}[,\.]\d{2})'),  # Qualquer número com 2 decimais
+    re.compile(r'(\d{1,2}[,\.]\d{2})'),  # Números menores com 2 decimais
+)
+
+# Normalização de valores monetários
+_AMOUNT_NOISE_PATTERN = re.compile(r'[^\d.,R\$]')
+_RS_GLUED_DIGIT_PATTERN = re.compile(r'R\$(\d)')
+_DECIMAL_AMOUNT_PATTERN = re.compile(r'\d+[.,]\d{2}')
+_RS_DECIMAL_AMOUNT_PATTERN = re.compile(r'R\$\s*\d+[.,]\d{2}')
+_RS_SPACING_PATTERN = re.compile(r'R\$\s*')
+
+# Limpeza do texto extraído
+_SPLIT_RS_PATTERN = re.compile(r'R\s*\$')
+_OCR_NOISE_PATTERN = re.compile(r'[^\w\s\.,\-\+\$R\(\)\/:\°áàâãéèêíìîóòôõúùûüçÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÜÇ]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Número do quadrante no nome do arquivo (ex: 'quadrante_03.png' -> 3)
+_QUADRANT_NUMBER_PATTERN = re.compile(r'quadrante_(\d+)')
+
+def _parenthesized_number(name):
+    """Retorna o primeiro número entre parênteses do nome (ex: 'pix (12)' -> 12) ou None"""
+    start = name.find('(')
+    while start != -1:
+        end = name.find(')', start + 1)
+        if end == -1:
+            return None
+        digits = name[start + 1:end]
+        if digits.isdecimal():
+            return int(digits)
+        start = name.find('(', start + 1)
+    return None
+
+
+def _parse_tesseract_config(config: str) -> Tuple[int, int, str]:
+    """Converte uma string de configuração do pytesseract em (oem, psm, idioma)"""
+    oem, psm, lang = 3, 3, 'eng'  # Padrões do próprio Tesseract
+    tokens = config.split()
+    for option, value in zip(tokens, tokens[1:]):
+        if option == '--oem':
+            oem = int(value)
+        elif option == '--psm':
+            psm = int(value)
+        elif option == '-l':
+            lang = value
+    return oem, psm, lang
+
+
+# Colunas do TSV do Tesseract (GetTSVText), as mesmas chaves do image_to_data do pytesseract
+_TSV_COLUMNS = ('level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+                'left', 'top', 'width', 'height', 'conf', 'text')
+
+
+class _TessPool:
+    """Instâncias PyTessBaseAPI reaproveitadas entre chamadas, agrupadas por (oem, idioma)
+    
+    Cada image_to_string do pytesseract abre um processo novo e recarrega o modelo
+    de idioma; aqui o modelo é carregado uma única vez e só o PSM muda por chamada.
+    Uma instância não pode ser usada por duas threads ao mesmo tempo, então cada
+    chamada retira uma instância livre (ou cria outra) e a devolve ao terminar.
+    
+    Cada instância mantém um modelo de idioma inteiro em memória: por (oem, idioma)
+    são criadas no máximo max_size instâncias (as threads de OCR do processo) e,
+    acima disso, a chamada espera uma ser devolvida. close() encerra as livres.
+    """
+    
+    def __init__(self, max_size=None):
+        self.max_size = max_size or os.cpu_count() or 1
+        self._idle = {}
+        self._created = Counter()
+        self._condition = threading.Condition()
+    
+    def _acquire(self, key):
+        with self._condition:
+            while True:
+                idle = self._idle.get(key)
+                if idle:
+                    return idle.pop()
+                if self._created[key] < self.max_size:
+                    self._created[key] += 1
+                    break
+                self._condition.wait()
+        oem, lang = key
+        try:
+            return tesserocr.PyTessBaseAPI(lang=lang, oem=oem)
+        except Exception:
+            with self._condition:
+                self._created[key] -= 1
+                self._condition.notify()
+            raise
+    
+    def _release(self, key, api):
+        with self._condition:
+            self._idle.setdefault(key, []).append(api)
+            self._condition.notify()
+    
+    def close(self):
+        """Encerra (End) as instâncias livres, liberando os modelos de idioma carregados"""
+        with self._condition:
+            idle, self._idle = self._idle, {}
+            for key, apis in idle.items():
+                self._created[key] -= len(apis)
+            self._condition.notify_all()
+        for apis in idle.values():
+            for api in apis:
+                api.End()
+    
+    def _recognize(self, image, config, read):
+        """Aplica read(api) à imagem com uma instância livre, configurada para `config`"""
+        oem, psm, lang = _parse_tesseract_config(config)
+        api = self._acquire((oem, lang))
+        try:
+            api.SetPageSegMode(psm)
+            if isinstance(image, np.ndarray):
+                # Escala de cinza: 1 byte por pixel, direto do buffer do array
+                height, width = image.shape
+                api.SetImageBytes(np.ascontiguousarray(image).tobytes(), width, height, 1, width)
+            else:
+                api.SetImage(image)
+            return read(api)
+        finally:
+            self._release((oem, lang), api)
+    
+    def image_to_string(self, image, config):
+        return self._recognize(image, config, lambda api: api.GetUTF8Text())
+    
+    def image_to_data(self, image, config):
+        """Mesmo dicionário de pytesseract.image_to_data(output_type=Output.DICT)"""
+        tsv = self._recognize(image, config, lambda api: api.GetTSVText(0))
+        data = {column: [] for column in _TSV_COLUMNS}
+        for row in tsv.splitlines():
+            values = row.split('\t', len(_TSV_COLUMNS) - 1)
+            if len(values) < len(_TSV_COLUMNS):
+                values.append('')  # Linhas de bloco/parágrafo/linha não têm texto
+            for column, value in zip(_TSV_COLUMNS, values):
+                if column == 'text':
+                    data[column].append(value)
+                elif column == 'conf':
+                    data[column].append(float(value))
+                else:
+                    data[column].append(int(value))
+        return data
+
+
+_TESS_POOL = _TessPool() if tesserocr is not None else None
+if _TESS_POOL is not None:
+    atexit.register(_TESS_POOL.close)
+
+# Configurações aplicadas a cada imagem/região em AdvancedOCR
+_OCR_CONFIGS = (
+    r'--oem 3 --psm 6',      # Bloco uniforme de texto
+    r'--oem 3 --psm 6 -l por',  # Com idioma português
+    r'--oem 3 --psm 3',      # Página completamente automática
+    r'--oem 3 --psm 4',      # Coluna de texto variável
+    r'--oem 3 --psm 7',      # Linha de texto
+    r'--oem 3 --psm 8',      # Uma palavra por vez
+    r'--oem 3 --psm 13',     # Linha de texto crua
+    r'--oem 1 --psm 6'       # OCR engine diferente
+)
+
+# Configuração da leitura única com image_to_data (texto esparso)
+_SINGLE_PASS_CONFIG = r'--oem 3 --psm 11 -l por'
+
+def _amount_agreement(texts):
+    """Quantos textos trazem o mesmo valor em R$ (o mais frequente) como primeiro valor"""
+    counts = Counter()
+    for text in texts:
+        match = _RS_DECIMAL_AMOUNT_PATTERN.search(text)
+        if match:
+            counts[_WHITESPACE_PATTERN.sub('', match.group(0))] += 1
+    return max(counts.values(), default=0)
+
+def _to_pil(image):
+    """Imagem PIL para o pytesseract; arrays em escala de cinza viram uma imagem 'L'
+    sobre o próprio buffer (sem a detecção de tipo e a cópia do Image.fromarray)"""
+    if not isinstance(image, np.ndarray):
+        return image
+    image = np.ascontiguousarray(image)
+    height, width = image.shape
+    return Image.frombuffer('L', (width, height), image, 'raw', 'L', 0, 1)
+
+
+@lru_cache(maxsize=1)
+def _ocr_backend_signature() -> Tuple[str, str]:
+    """Backend de OCR em uso e versão do Tesseract (entram na chave do cache de OCR)"""
+    try:
+        if tesserocr is not None:
+            return 'tesserocr', tesserocr.tesseract_version()
+        return 'pytesseract', str(pytesseract.get_tesseract_version())
+    except Exception:
+        return ('tesserocr' if tesserocr is not None else 'pytesseract'), 'desconhecida'
+
+
+def _image_to_string(image, config):
+    """OCR de uma imagem (array em escala de cinza ou PIL) via tesserocr quando
+    disponível, senão via pytesseract"""
+    if _TESS_POOL is not None:
+        return _TESS_POOL.image_to_string(image, config)
+    return pytesseract.image_to_string(_to_pil(image), config=config)
+
+
+def _image_to_data(image, config):
+    """Palavras com posição e confiança (dicionário do image_to_data), via tesserocr
+    quando disponível, senão via pytesseract"""
+    if _TESS_POOL is not None:
+        return _TESS_POOL.image_to_data(image, config)
+    return pytesseract.image_to_data(_to_pil(image), config=config, output_type=pytesseract.Output.DICT)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_amount(amount_text):
+    """Normaliza valores monetários para formato padrão
+    
+    Função pura sobre textos curtos: o mesmo valor é normalizado várias vezes por
+    quadrante (um por padrão e por texto), então o resultado fica em cache.
+    """
+    if not amount_text:
+        return None
+    
+    # Remove espaços extras e caracteres estranhos
+    cleaned = _AMOUNT_NOISE_PATTERN.sub('', amount_text)
+    
+    # Corrige padrões comuns de erro
+    cleaned = cleaned.replace('R$.', 'R$ ')  # R$.5,00 -> R$ 5,00
+    cleaned = _RS_GLUED_DIGIT_PATTERN.sub(r'R$ \1', cleaned)  # R$22,00 -> R$ 22,00
+    
+    # Garante que tem pelo menos R$ e números
+    if 'R$' in cleaned or _DECIMAL_AMOUNT_PATTERN.search(cleaned):
+        # Adiciona R$ se não tiver
+        if not cleaned.startswith('R$'):
+            cleaned = 'R$ ' + cleaned
+        
+        # Normaliza espaçamento
+        cleaned = _RS_SPACING_PATTERN.sub('R$ ', cleaned)
+        
+        return cleaned.strip()
+    
+    return None
+
+
+def _day_to_json_obj(day_data):
+    """Dicionário do dia para o JSON, montado direto (mesmas chaves e ordem do asdict,
+    sem a cópia profunda recursiva)"""
+    return {
+        'day_folder': day_data.day_folder,
+        'date_info': day_data.date_info,
+        'header_text': day_data.header_text,
+        'transactions': [
+            {
+                'quadrant_number': t.quadrant_number,
+                'raw_text': t.raw_text,
+                'processed_text': t.processed_text,
+                'confidence': t.confidence,
+                'timestamp': t.timestamp,
+                'amount': t.amount,
+            }
+            for t in day_data.transactions
+        ],
+        'total_quadrants': day_data.total_quadrants,
+        'processing_timestamp': day_data.processing_timestamp,
+    }
+
+@lru_cache(maxsize=1)
+def _get_orjson():
+    """Importa o orjson só na primeira gravação de JSON (ou None se não estiver instalado)
+
+    Opcional: serialização JSON bem mais rápida (serializa dataclasses direto). A
+    importação tardia evita o custo nas opções do menu que não gravam arquivos.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps_json(day_data, pretty=False):
+    """JSON do dia em UTF-8 (acentos sem escape) como bytes, prontos para uma única escrita
+
+    Por padrão a saída é compacta; ``pretty=True`` gera o JSON indentado para leitura humana.
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        # O orjson serializa as dataclasses diretamente
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(day_data, option=option)
+    if pretty:
+        return json.dumps(_day_to_json_obj(day_data), ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(_day_to_json_obj(day_data), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
 # Configuração automática do Tesseract para Windows
-def setup_tesseract():
-    """Configura o caminho do Tesseract automaticamente"""
+@lru_cache(maxsize=1)
+def _resolve_tesseract() -> Optional[str]:
+    """Localiza o executável do Tesseract uma única vez por processo"""
     possible_paths = [
         r'C:\Program Files\Tesseract-OCR\tesseract.exe',
         r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
@@ -28,19 +379,29 @@ def setup_tesseract():
                 result = subprocess.run(['tesseract', '--version'], 
                                       capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
-                    return True
+                    return path
             else:
                 if os.path.exists(path):
-                    pytesseract.pytesseract.tesseract_cmd = path
-                    print(f"✅ Tesseract encontrado em: {path}")
-                    return True
+                    return path
         except Exception:
             continue
     
-    return False
+    return None
 
-# Tenta configurar o Tesseract automaticamente
-if not setup_tesseract():
+def setup_tesseract():
+    """Configura o caminho do Tesseract automaticamente"""
+    path = _resolve_tesseract()
+    if path is None:
+        return False
+    
+    if path != 'tesseract' and pytesseract.pytesseract.tesseract_cmd != path:
+        pytesseract.pytesseract.tesseract_cmd = path
+        print(f"✅ Tesseract encontrado em: {path}")
+    return True
+
+# Tenta configurar o Tesseract automaticamente (a configuração manual só é pedida no
+# processo principal; os processos de trabalho recebem o caminho já configurado)
+if not setup_tesseract() and multiprocessing.parent_process() is None:
     print("⚠️  Tesseract não encontrado automaticamente!")
     print("Por favor, instale o Tesseract OCR ou configure manualmente:")
     print("1. Baixe em: https://github.com/UB-Mannheim/tesseract/wiki")
@@ -79,7 +440,13 @@ def test_tesseract():
         return False
 
 
-@dataclass
+# slots=True só existe a partir do Python 3.10; em versões anteriores as
+# instâncias continuam com __dict__ (um __slots__ manual conflitaria com os
+# valores padrão dos campos)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TransactionData:
     """Estrutura para dados de uma transação"""
     quadrant_number: int
@@ -88,10 +455,9 @@ class TransactionData:
     confidence: float = 0.0
     timestamp: Optional[str] = None
     amount: Optional[str] = None
-    description: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DayData:
     """Estrutura para dados de um dia completo"""
     day_folder: str
@@ -103,14 +469,176 @@ class DayData:
 
 
 class AdvancedOCR:
-    """Sistema avançado de OCR com múltiplas estratégias"""
+    """Sistema avançado de OCR com múltiplas estratégias
     
-    def __init__(self, chunk_height=1200, overlap=100):
+    legacy_preprocess=True reproduz exatamente o pré-processamento original
+    (fastNlMeansDenoising, CLAHE 2.0, binarização adaptativa e redução Lanczos para
+    2000 px), ignorando fast_preprocess, denoise, binarization, max_width e use_opencl.
+    Serve de referência para comparar a qualidade das opções mais rápidas.
+    """
+    
+    def __init__(self, chunk_height=1200, overlap=100, fast_preprocess=True, binarization='adaptive',
+                 cache_dir=None, max_workers=None, denoise='bilateral', early_exit=True,
+                 single_pass=False, use_opencl=False, max_width=1600, legacy_preprocess=False):
         self.chunk_height = chunk_height
         self.overlap = overlap
+        # Threads para as chamadas do Tesseract (None = número de núcleos)
+        self.max_workers = max_workers or os.cpu_count()
+        # Pré-processamento rápido: CLAHE único e suave, sem fastNlMeansDenoising.
+        # Use False para a cadeia denoise + CLAHE(2.0), ou legacy_preprocess=True
+        # para a cadeia original completa, caso a qualidade caia.
+        self.fast_preprocess = fast_preprocess
+        self.legacy_preprocess = legacy_preprocess
+        # 'adaptive' (padrão original, bom para fotos com iluminação irregular), 'otsu' (global,
+        # ideal para capturas de tela) ou None: entrega a imagem em tons de cinza e deixa o
+        # Tesseract (LSTM) binarizar. None só deve virar padrão após comparar a confiança do
+        # OCR nas capturas reais
+        self.binarization = binarization
+        # Filtro do pré-processamento completo: 'bilateral' (rápido) ou 'nlmeans' (fastNlMeansDenoising)
+        self.denoise = denoise
+        # Encerra após a imagem completa quando ao menos 3 configurações leem o mesmo valor
+        self.early_exit = early_exit
+        # Uma única leitura por imagem (image_to_data, PSM 11) no lugar das 8 configurações;
+        # as variantes de texto são remontadas a partir das palavras e suas posições
+        self.single_pass = single_pass
+        # Pré-processamento via T-API do OpenCV (cv2.UMat). Desligado por padrão: consultar o
+        # OpenCL cria o contexto da GPU, que não sobrevive ao fork dos processos de dias
+        self.use_opencl = use_opencl
+        # Largura máxima antes do OCR: ~300 DPI já é o pico de precisão do Tesseract,
+        # acima disso só aumenta o custo (None = não reduz)
+        self.max_width = max_width
+        # O objeto CLAHE não guarda estado entre imagens, mas reaproveita buffers
+        # internos: é criado uma única vez por thread (ver _get_clahe)
+        self._clahe_clip_limit = 1.0 if fast_preprocess and not legacy_preprocess else 2.0
+        self._clahe_local = threading.local()
+        
+        # Cache em disco dos resultados de OCR, indexado pelo hash do conteúdo da imagem
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def __getstate__(self):
+        """Estado para pickle: o CLAHE por thread fica de fora"""
+        state = self.__dict__.copy()
+        del state['_clahe_local']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._clahe_local = threading.local()
+    
+    def _get_cache_file(self, image_path):
+        """Arquivo de cache para a imagem (hash do conteúdo + configurações de OCR)"""
+        with open(image_path, 'rb') as f:
+            if xxhash is not None:
+                image_hash = xxhash.xxh64(f.read()).hexdigest()
+            elif hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                image_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+            else:
+                image_hash = hashlib.sha256(f.read()).hexdigest()
+        
+        # Configurações, backend e versão do Tesseract diferentes produzem textos
+        # diferentes para a mesma imagem
+        settings = repr((self.fast_preprocess, self.binarization, self.denoise,
+                         self.early_exit, self.single_pass, self.use_opencl,
+                         self.max_width, self.legacy_preprocess, _OCR_CONFIGS, _SINGLE_PASS_CONFIG,
+                         _ocr_backend_signature())).encode('utf-8')
+        settings_hash = hashlib.sha256(settings).hexdigest()[:8]
+        
+        return self.cache_dir / f"{image_hash}_{settings_hash}.json"
+    
+    @staticmethod
+    def _read_cache(cache_file):
+        """Resultado em cache como (texto, confiança), ou None se ausente/ilegível"""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return cached['text'], cached['confidence']
+        except (OSError, ValueError, KeyError, TypeError):
+            # Arquivo inexistente, truncado ou de outro formato: trata como ausente
+            return None
+    
+    @staticmethod
+    def _write_cache(cache_file, text, confidence):
+        """Grava o cache de forma atômica (arquivo temporário + os.replace)
+        
+        Threads ou processos que processam a mesma imagem nunca deixam um arquivo
+        pela metade; uma falha de gravação só perde o cache, não o resultado.
+        """
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_file.parent,
+                                             suffix='.tmp', delete=False) as f:
+                temp_path = f.name
+                json.dump({'text': text, 'confidence': confidence}, f, ensure_ascii=False)
+            os.replace(temp_path, cache_file)
+        except OSError:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def _get_clahe(self):
+        """CLAHE da thread atual, criado na primeira imagem processada por ela"""
+        clahe = getattr(self._clahe_local, 'clahe', None)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=self._clahe_clip_limit, tileGridSize=(8,8))
+            self._clahe_local.clahe = clahe
+        return clahe
     
     def enhance_image_for_ocr(self, image_path):
         """Melhora a imagem para OCR"""
+        if self.legacy_preprocess:
+            return self._enhance_image_legacy(image_path)
+        
+        # Decodifica direto em escala de cinza (dispensa o cvtColor BGR -> GRAY)
+        gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            raise ValueError(f"Não foi possível carregar a imagem: {image_path}")
+        
+        # Redimensiona se muito grande (mantém proporção)
+        height, width = gray.shape
+        if self.use_opencl:
+            # As etapas seguintes são despachadas para o OpenCL; o resultado só volta
+            # para a memória principal no final
+            gray = cv2.UMat(gray)
+        if self.max_width and width > self.max_width:
+            scale = self.max_width / width
+            new_width = int(width * scale)
+            new_height = int(height * scale)
+            # INTER_AREA: mais rápido que Lanczos na redução e sem artefatos de ringing
+            gray = cv2.resize(gray, (new_width, new_height), interpolation=cv2.INTER_AREA)
+        
+        if self.fast_preprocess:
+            # O denoising removia principalmente o ruído amplificado pelo próprio
+            # CLAHE; um CLAHE com clipLimit menor dispensa essa etapa (a mais cara)
+            enhanced = self._get_clahe().apply(gray)
+        else:
+            # Aplica denoising (o bilateral preserva as bordas do texto a uma
+            # fração do custo das médias não locais)
+            if self.denoise == 'nlmeans':
+                denoised = cv2.fastNlMeansDenoising(gray)
+            else:
+                denoised = cv2.bilateralFilter(gray, d=5, sigmaColor=50, sigmaSpace=50)
+            
+            # Melhora contraste
+            enhanced = self._get_clahe().apply(denoised)
+        
+        if self.binarization == 'adaptive':
+            # Binarização adaptativa
+            binary = cv2.adaptiveThreshold(
+                enhanced, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
+                cv2.THRESH_BINARY, 11, 2
+            )
+        elif self.binarization == 'otsu':
+            # Otsu: um único histograma, suficiente para fundos uniformes
+            _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        else:
+            # O Tesseract binariza internamente e prefere receber tons de cinza
+            binary = enhanced
+        
+        return binary.get() if self.use_opencl else binary
+    
+    def _enhance_image_legacy(self, image_path):
+        """Pré-processamento original, sem nenhuma das otimizações posteriores"""
         img = cv2.imread(image_path)
         if img is None:
             raise ValueError(f"Não foi possível carregar a imagem: {image_path}")
@@ -130,16 +658,13 @@ class AdvancedOCR:
         denoised = cv2.fastNlMeansDenoising(gray)
         
         # Melhora contraste
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-        enhanced = clahe.apply(denoised)
+        enhanced = self._get_clahe().apply(denoised)
         
         # Binarização adaptativa
-        binary = cv2.adaptiveThreshold(
+        return cv2.adaptiveThreshold(
             enhanced, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
             cv2.THRESH_BINARY, 11, 2
         )
-        
-        return binary
     
     def split_image_vertically(self, image, chunk_height=None):
         """Divide a imagem em pedaços verticais com sobreposição"""
@@ -171,12 +696,9 @@ class AdvancedOCR:
         full_text = ""
         
         for i, (chunk, y_start, y_end) in enumerate(chunks):
-            # Converte para PIL Image
-            chunk_pil = Image.fromarray(chunk)
-            
             # Aplica OCR com configurações otimizadas
             custom_config = r'--oem 3 --psm 6 -l por'
-            text = pytesseract.image_to_string(chunk_pil, config=custom_config)
+            text = _image_to_string(chunk, custom_config)
             
             # Remove duplicatas na sobreposição (básico)
             if i > 0 and full_text:
@@ -192,57 +714,90 @@ class AdvancedOCR:
     def extract_text_with_confidence(self, image_path):
         """Extrai texto com informações de confiança usando múltiplas estratégias e regiões"""
         try:
+            # Reaproveita o resultado de execuções anteriores sobre a mesma imagem
+            cache_file = self._get_cache_file(image_path) if self.cache_dir else None
+            cached = self._read_cache(cache_file) if cache_file else None
+            if cached is not None:
+                return cached
+            
             processed_img = self.enhance_image_for_ocr(image_path)
             
-            all_texts = []
-            
-            # Estratégia 1: Imagem completa
-            pil_img = Image.fromarray(processed_img)
-            texts_full = self._extract_with_multiple_configs(pil_img)
-            all_texts.extend(texts_full)
-            
-            # Estratégia 2: Divide em regiões (topo, meio, fundo) para capturar texto perdido
-            height, width = processed_img.shape
-            regions = [
-                (0, 0, width, height // 3),           # Região superior
-                (0, height // 3, width, 2 * height // 3),  # Região central  
-                (0, 2 * height // 3, width, height), # Região inferior
-                (0, 0, width // 2, height),          # Lado esquerdo
-                (width // 2, 0, width, height),      # Lado direito
-            ]
-            
-            for x, y, x2, y2 in regions:
-                region_img = processed_img[y:y2, x:x2]
-                if region_img.size > 0:
-                    region_pil = Image.fromarray(region_img)
-                    region_texts = self._extract_with_multiple_configs(region_pil)
-                    all_texts.extend(region_texts)
-            
-            # Estratégia 3: Tenta diferentes escalas
-            for scale in [0.8, 1.2, 1.5]:
-                try:
-                    scaled_height = int(height * scale)
-                    scaled_width = int(width * scale)
-                    scaled_img = cv2.resize(processed_img, (scaled_width, scaled_height), 
-                                          interpolation=cv2.INTER_CUBIC)
-                    scaled_pil = Image.fromarray(scaled_img)
-                    scaled_texts = self._extract_with_multiple_configs(scaled_pil)
-                    all_texts.extend(scaled_texts)
-                except Exception:
-                    continue
+            # O Tesseract libera o GIL: as combinações imagem × configuração rodam
+            # em paralelo; map() devolve os textos na mesma ordem da execução sequencial
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Estratégia 1: Imagem completa
+                if self.single_pass:
+                    all_texts = self._extract_single_pass(processed_img)
+                else:
+                    all_texts = list(executor.map(lambda config: self._extract_with_config(processed_img, config),
+                                                  _OCR_CONFIGS))
+                
+                # Imagem "fácil": várias configurações já concordam no valor, então as
+                # regiões e escalas (a maior parte do custo) são dispensadas. Na leitura
+                # única as variantes vêm do mesmo OCR e não contam como concordância.
+                early_exit = (self.early_exit and not self.single_pass
+                              and _amount_agreement(all_texts) >= 3)
+                
+                if not early_exit:
+                    images = []
+                    
+                    # Estratégia 2: Divide em regiões (topo, meio, fundo) para capturar texto perdido
+                    height, width = processed_img.shape
+                    regions = [
+                        (0, 0, width, height // 3),           # Região superior
+                        (0, height // 3, width, 2 * height // 3),  # Região central  
+                        (0, 2 * height // 3, width, height), # Região inferior
+                        (0, 0, width // 2, height),          # Lado esquerdo
+                        (width // 2, 0, width, height),      # Lado direito
+                    ]
+                    
+                    for x, y, x2, y2 in regions:
+                        region_img = processed_img[y:y2, x:x2]
+                        if region_img.size > 0:
+                            images.append(region_img)
+                    
+                    # Estratégia 3: Tenta diferentes escalas
+                    for scale in [0.8, 1.2, 1.5]:
+                        try:
+                            scaled_height = int(height * scale)
+                            scaled_width = int(width * scale)
+                            # Área para reduzir; bilinear basta para as ampliações pequenas
+                            interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+                            scaled_img = cv2.resize(processed_img, (scaled_width, scaled_height), 
+                                                  interpolation=interpolation)
+                            images.append(scaled_img)
+                        except Exception:
+                            continue
+                    
+                    if self.single_pass:
+                        for texts in executor.map(self._extract_single_pass, images):
+                            all_texts.extend(texts)
+                    else:
+                        work_items = [(image, config) for image in images for config in _OCR_CONFIGS]
+                        all_texts.extend(executor.map(lambda item: self._extract_with_config(*item), work_items))
             
-            # Remove duplicatas e vazio
+            # Remove duplicatas e vazio (o conjunto evita varrer a lista a cada texto)
             unique_texts = []
+            seen_texts = set()
             for text in all_texts:
                 cleaned = text.strip()
-                if cleaned and cleaned not in unique_texts:
+                if cleaned and cleaned not in seen_texts:
+                    seen_texts.add(cleaned)
                     unique_texts.append(cleaned)
             
             if unique_texts:
                 # Combina todos os textos únicos
                 combined_text = "\n".join(unique_texts)
-                # Estima confiança baseada no número de fontes que encontraram texto
-                estimated_confidence = min(90, 30 + (len(unique_texts) * 10))
+                if early_exit:
+                    estimated_confidence = 80.0
+                else:
+                    # Estima confiança baseada no número de fontes que encontraram texto
+                    estimated_confidence = min(90, 30 + (len(unique_texts) * 10))
+                
+                # Resultados vazios não vão para o cache (podem ser falha do Tesseract)
+                if cache_file:
+                    self._write_cache(cache_file, combined_text, estimated_confidence)
+                
                 return combined_text, estimated_confidence
             
             return "", 0.0
@@ -251,28 +806,84 @@ class AdvancedOCR:
             print(f"Erro crítico no OCR de {image_path}: {str(e)}")
             return f"ERRO CRÍTICO: {str(e)}", 0.0
     
-    def _extract_with_multiple_configs(self, pil_img):
-        """Extrai texto usando múltiplas configurações do Tesseract"""
-        configs = [
-            r'--oem 3 --psm 6',      # Bloco uniforme de texto
-            r'--oem 3 --psm 6 -l por',  # Com idioma português
-            r'--oem 3 --psm 3',      # Página completamente automática
-            r'--oem 3 --psm 4',      # Coluna de texto variável
-            r'--oem 3 --psm 7',      # Linha de texto
-            r'--oem 3 --psm 8',      # Uma palavra por vez
-            r'--oem 3 --psm 13',     # Linha de texto crua
-            r'--oem 1 --psm 6'       # OCR engine diferente
-        ]
-        
-        texts = []
+    def batch_extract(self, image_paths, config=r'--oem 3 --psm 6 -l por'):
+        """Leitura rápida de várias imagens em uma única execução do Tesseract
+        
+        O Tesseract aceita um arquivo .txt com a lista de imagens e separa as páginas
+        com form feed; assim o processo e o modelo de idioma são carregados uma vez
+        só. Retorna um texto por imagem, na mesma ordem, ou lista vazia em caso de falha.
+        """
+        if not image_paths:
+            return []
         
-        for config in configs:
+        try:
+            if _TESS_POOL is not None:
+                # Com o tesserocr não há processo a amortizar
+                texts = []
+                for image_path in image_paths:
+                    with Image.open(image_path) as pil_img:
+                        texts.append(_image_to_string(pil_img, config))
+                return [text.strip() for text in texts]
+            
+            with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as list_file:
+                list_file.write('\n'.join(str(path) for path in image_paths))
             try:
-                text = pytesseract.image_to_string(pil_img, config=config)
-                if text.strip():
-                    texts.append(text.strip())
-            except Exception:
+                output = pytesseract.image_to_string(list_file.name, config=config)
+            finally:
+                os.unlink(list_file.name)
+        except Exception as e:
+            print(f"Erro no OCR em lote: {str(e)}")
+            return []
+        
+        pages = output.split('\f')
+        if len(pages) < len(image_paths):
+            return []
+        return [page.strip() for page in pages[:len(image_paths)]]
+    
+    def _extract_single_pass(self, image):
+        """Lê a imagem uma única vez (PSM 11) e remonta as variantes de texto
+        
+        Retorna o texto por linha, na ordem de leitura (topo, esquerda), e o texto
+        só com as palavras de confiança acima de 60.
+        """
+        try:
+            data = _image_to_data(image, _SINGLE_PASS_CONFIG)
+        except Exception:
+            return []
+        
+        lines = {}  # (bloco, parágrafo, linha) -> [topo, esquerda, palavras]
+        confident_words = []
+        for word, conf, top, left, block, par, line in zip(
+                data['text'], data['conf'], data['top'], data['left'],
+                data['block_num'], data['par_num'], data['line_num']):
+            word = word.strip()
+            if not word:
                 continue
+            entry = lines.setdefault((block, par, line), [top, left, []])
+            entry[2].append(word)
+            if float(conf) > 60:
+                confident_words.append(word)
+        
+        ordered_lines = sorted(lines.values(), key=lambda entry: (entry[0], entry[1]))
+        texts = ["\n".join(" ".join(words) for _, _, words in ordered_lines),
+                 " ".join(confident_words)]
+        return [text for text in texts if text]
+    
+    def _extract_with_config(self, image, config):
+        """Extrai texto com uma configuração do Tesseract ("" em caso de falha)"""
+        try:
+            return _image_to_string(image, config).strip()
+        except Exception:
+            return ""
+    
+    def _extract_with_multiple_configs(self, image):
+        """Extrai texto usando múltiplas configurações do Tesseract"""
+        texts = []
+        
+        for config in _OCR_CONFIGS:
+            text = self._extract_with_config(image, config)
+            if text:
+                texts.append(text)
         
         return texts
 
@@ -280,18 +891,34 @@ class AdvancedOCR:
 class StructuredTransactionOCR:
     """Sistema principal de OCR estruturado para transações organizadas por dia"""
     
-    def __init__(self, base_folder_path, output_folder=None):
+    def __init__(self, base_folder_path, output_folder=None, batch_baseline=False, pretty_json=False,
+                 quadrant_workers=None):
         self.base_folder = Path(base_folder_path)
         base_output_folder = Path(output_folder) if output_folder else self.base_folder.parent / "processed"
-        self.ocr_engine = AdvancedOCR()
+        self.base_output_folder = base_output_folder
         
         # Extrai informações do caminho da pasta para nomenclatura dos arquivos
         self.path_info = self._extract_path_info()
+        # Prefixo fixo para a instância ("mes_tipo"); só o índice varia por arquivo
+        self._base_prefix = f"{self.path_info['month']}_{self.path_info['transaction_type']}"
         
         # Cria pasta de saída com subpasta do mês e tipo de transação
         self.output_folder = base_output_folder / self.path_info['month'] / self.path_info['transaction_type']
         self.output_folder.mkdir(parents=True, exist_ok=True)
         
+        # Quadrantes de um dia processados em paralelo (o Tesseract aproveita bem ~4 núcleos);
+        # as threads de OCR de cada quadrante dividem os núcleos restantes
+        self.quadrant_workers = quadrant_workers or max(1, (os.cpu_count() or 1) // 4)
+        ocr_workers = max(1, (os.cpu_count() or 1) // self.quadrant_workers)
+        
+        # Resultados de OCR ficam em cache junto da saída, para reprocessamentos rápidos
+        self.ocr_engine = AdvancedOCR(cache_dir=self.output_folder / ".ocr_cache", max_workers=ocr_workers)
+        # Leitura rápida de todos os quadrantes do dia em lote; o OCR completo
+        # (múltiplas configurações/regiões) só roda onde ela não encontra valor
+        self.batch_baseline = batch_baseline
+        # JSON compacto por padrão (menor e mais rápido); indentado só se pedido
+        self.pretty_json = pretty_json
+        
         # Padrões regex para extrair informações
         self.date_patterns = [
             # Padrões específicos para meses abreviados em português
@@ -328,6 +955,10 @@ class StructuredTransactionOCR:
             r'[\d.,]+\s*reais?',                          # Números seguidos de "reais"
             r'\$\s*[\d.,]+',                              # $ 22,00
         ]
+        
+        # Versões compiladas dos padrões acima, montadas uma única vez
+        self._date_regexes = [re.compile(p, re.IGNORECASE) for p in self.date_patterns]
+        self._amount_regexes = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in self.amount_patterns]
     
     def _extract_path_info(self):
         """Extrai informações do caminho para nomenclatura dos arquivos"""
@@ -341,17 +972,11 @@ class StructuredTransactionOCR:
             part_lower = part.lower()
             
             # Identifica mês
-            meses = ['janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
-                    'julho', 'agosto', 'setembro', 'outubro', 'novembro', 'dezembro']
-            meses_abrev = ['jan', 'fev', 'mar', 'abr', 'mai', 'jun',
-                          'jul', 'ago', 'set', 'out', 'nov', 'dez']
-            
-            if part_lower in meses or part_lower in meses_abrev:
+            if part_lower in _MESES or part_lower in _MESES_ABREV:
                 month = part_lower
             
             # Identifica tipo de transação
-            tipos = ['debito', 'credito', 'pix', 'debit', 'credit']
-            if part_lower in tipos:
+            if part_lower in _TIPOS_TRANSACAO:
                 transaction_type = part_lower
         
         return {
@@ -361,69 +986,69 @@ class StructuredTransactionOCR:
     
     def _generate_file_prefix(self, index=None):
         """Gera prefixo para nomes de arquivos baseado na estrutura de pastas"""
-        month = self.path_info['month']
-        trans_type = self.path_info['transaction_type']
-        
         if index is not None:
-            return f"{month}_{trans_type}_{index:03d}"
+            return f"{self._base_prefix}_{index:03d}"
         else:
-            return f"{month}_{trans_type}"
+            return self._base_prefix
     
     def extract_day_folders(self):
         """Extrai todas as pastas de dias (Screenshot_YYYYMMDD_HHMMSS_Ton ou pix (x))"""
         if not self.base_folder.exists():
             raise FileNotFoundError(f"Pasta base não encontrada: {self.base_folder}")
         
-        # Procura por pastas
-        day_folders = []
-        for folder in self.base_folder.iterdir():
-            if folder.is_dir():
-                day_folders.append(folder)
-        
-        # Ordena numericamente por números entre parênteses, senão alfabeticamente
-        def sort_key(folder):
-            name = folder.name
-            
-            # Procura por números entre parênteses em qualquer posição do nome
-            match = re.search(r'\((\d+)\)', name)
-            if match:
-                return (0, int(match.group(1)))  # Ordena numericamente pelo número
-            else:
-                return (1, name.lower())  # Ordena alfabeticamente se não tem número
+        # Procura por pastas em uma única varredura, já calculando a chave de ordenação:
+        # numericamente por números entre parênteses, senão alfabeticamente
+        keyed_folders = []
+        with os.scandir(self.base_folder) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                
+                number = _parenthesized_number(entry.name)
+                if number is not None:
+                    sort_key = (0, number)  # Ordena numericamente pelo número
+                else:
+                    sort_key = (1, entry.name.lower())  # Ordena alfabeticamente se não tem número
+                keyed_folders.append((sort_key, entry.path))
         
-        day_folders.sort(key=sort_key)
-        return day_folders
+        keyed_folders.sort(key=lambda item: item[0])
+        return [Path(path) for _, path in keyed_folders]
     
     def get_quadrant_images(self, day_folder):
         """Obtém todas as imagens de quadrantes de um dia, ordenadas"""
         images = []
         
-        # Procura por diferentes tipos de arquivo de imagem
-        image_extensions = ["*.jpg", "*.jpeg", "*.png", "*.bmp", "*.tiff"]
-        
-        for extension in image_extensions:
-            for img_file in day_folder.glob(extension):
+        # Procura por diferentes tipos de arquivo de imagem em uma única varredura;
+        # a posição da extensão desempata a ordenação como na busca por extensão
+        with os.scandir(day_folder) as entries:
+            for entry in entries:
+                extension_rank = _IMAGE_EXTENSIONS.get(os.path.splitext(entry.name)[1].lower())
+                if extension_rank is None or not entry.is_file():
+                    continue
+                img_file = Path(entry.path)
+                
                 # Para pastas Screenshot, pega todas as imagens
                 if day_folder.name.startswith('Screenshot_'):
                     # Usa timestamp do arquivo como "número do quadrante"
-                    creation_time = img_file.stat().st_mtime
-                    images.append((creation_time, img_file))
+                    creation_time = entry.stat().st_mtime
+                    images.append((creation_time, extension_rank, img_file))
                 
                 # Para pastas pix, procura por quadrantes específicos
-                elif "quadrante" in img_file.name:
-                    match = re.search(r'quadrante_(\d+)', img_file.name)
+                elif "quadrante" in entry.name:
+                    match = _QUADRANT_NUMBER_PATTERN.search(entry.name)
                     if match:
                         quadrant_num = int(match.group(1))
-                        images.append((quadrant_num, img_file))
+                        images.append((quadrant_num, extension_rank, img_file))
                 
                 # Se não encontrar padrão específico, usa ordem alfabética
                 else:
                     # Atribui um número baseado no nome do arquivo
-                    file_order = hash(img_file.name) % 10000
-                    images.append((file_order, img_file))
+                    file_order = hash(entry.name) % 10000
+                    images.append((file_order, extension_rank, img_file))
         
         # Ordena por número/timestamp do quadrante
-        images.sort(key=lambda x: x[0])
+        images.sort(key=lambda x: x[:2])
+        images = [(order, img_file) for order, _, img_file in images]
         
         # Para pastas Screenshot, converte timestamp para números sequenciais
         if images and day_folder.name.startswith('Screenshot_'):
@@ -439,10 +1064,11 @@ class StructuredTransactionOCR:
         if not text:
             return None
             
-        for pattern in self.date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+        # search() para no primeiro casamento; findall() percorria o texto inteiro
+        for regex in self._date_regexes:
+            match = regex.search(text)
+            if match:
+                return match.group(0)
         
         return None
     
@@ -454,111 +1080,78 @@ class StructuredTransactionOCR:
         amounts = []
         
         # Aplica cada padrão ao texto
-        for pattern in self.amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            amounts.extend(matches)
+        for regex in self._amount_regexes:
+            amounts.extend(regex.findall(text))
         
         # Remove duplicatas e normaliza valores
         normalized_amounts = []
+        seen_amounts = set()
         for amount in amounts:
             normalized = self._normalize_amount(amount)
-            if normalized and normalized not in normalized_amounts:
+            if normalized and normalized not in seen_amounts:
+                seen_amounts.add(normalized)
                 normalized_amounts.append(normalized)
         
         return normalized_amounts
     
     def _normalize_amount(self, amount_text):
         """Normaliza valores monetários para formato padrão"""
-        if not amount_text:
+        return _normalize_amount(amount_text)
+    
+    def _first_amount(self, text):
+        """Primeiro valor de extract_amounts(text), sem aplicar os padrões restantes"""
+        if not text:
             return None
         
-        # Remove espaços extras e caracteres estranhos
-        cleaned = re.sub(r'[^\d.,R\$]', '', amount_text)
-        
-        # Corrige padrões comuns de erro
-        cleaned = cleaned.replace('R$.', 'R$ ')  # R$.5,00 -> R$ 5,00
-        cleaned = re.sub(r'R\$(\d)', r'R$ \1', cleaned)  # R$22,00 -> R$ 22,00
-        
-        # Garante que tem pelo menos R$ e números
-        if 'R$' in cleaned or re.search(r'\d+[.,]\d{2}', cleaned):
-            # Adiciona R$ se não tiver
-            if not cleaned.startswith('R$'):
-                cleaned = 'R$ ' + cleaned
-            
-            # Normaliza espaçamento
-            cleaned = re.sub(r'R\$\s*', 'R$ ', cleaned)
-            
-            return cleaned.strip()
+        for regex in self._amount_regexes:
+            for amount in regex.findall(text):
+                normalized = self._normalize_amount(amount)
+                if normalized:
+                    return normalized
         
         return None
     
     def extract_amount_smart(self, raw_text, processed_text):
         """Extração inteligente de valores considerando contexto"""
-        # Tenta extrair de ambos os textos
-        amounts_raw = self.extract_amounts(raw_text)
-        amounts_processed = self.extract_amounts(processed_text)
-        
-        # Combina resultados
-        all_amounts = amounts_raw + amounts_processed
+        # Tenta extrair de ambos os textos (o bruto tem prioridade); cada etapa
+        # só roda se as anteriores não encontraram nada
+        amount = self._first_amount(raw_text) or self._first_amount(processed_text)
+        if amount:
+            return amount
         
         # Se não encontrou nada, tenta padrões mais agressivos
-        if not all_amounts:
-            # Combina todos os textos para busca mais ampla
-            combined_text = f"{raw_text}\n{processed_text}"
-            
-            # Padrões específicos mais agressivos
-            aggressive_patterns = [
-                r'R\$\s*\d+[.,]\d{2}',           # R$ 22,00 ou R$ 22.00
-                r'R\$\s*\d+',                    # R$ 22
-                r'RS\s*\d+[.,]\d{2}',           # RS 22,00 (erro comum OCR)
-                r'R\$\.?\s*\d+[.,]?\d*',        # R$.22,00 ou R$. 22
-                r'Pix.*?R\$\s*[\d.,]+',         # Pix ... R$ 22,00
-                r'(?:Pix|Dix).*?(\d+[.,]\d{2})', # Pix/Dix ... 22,00
-                r'(\d+[.,]\d{2}).*?(?:Pix|Dix)', # 22,00 ... Pix/Dix
-                r'(\d{1,3}[.,]\d{2})\s*(?=\s|$|Processando)', # Valor antes de "Processando"
-                # Busca valores isolados que possam ter sido separados
-                r'(?<!\d)(\d{1,3}[.,]\d{2})(?!\d)',  # Valores isolados
-                r'(?<!\d)(\d{1,2},\d{2})(?!\d)',     # 16,00 isolado
-                r'(?<!\d)(\d{1,2}\.\d{2})(?!\d)',    # 16.00 isolado
-            ]
-            
-            for pattern in aggressive_patterns:
-                matches = re.findall(pattern, combined_text, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        match = match[0]
-                    
-                    # Tenta normalizar o valor encontrado
-                    normalized = self._normalize_amount('R$ ' + str(match).strip())
-                    if normalized and normalized not in all_amounts:
-                        all_amounts.append(normalized)
-            
-            # Se ainda não encontrou, procura padrões extremamente flexíveis
-            if not all_amounts:
-                # Busca sequências numéricas que possam ser valores
-                number_patterns = [
-                    r'(\d{1,3}[,\.]\d{2})',  # Qualquer número com 2 decimais
-                    r'(\d{1,2}[,\.]\d{2})',  # Números menores com 2 decimais
-                ]
+        # Combina todos os textos para busca mais ampla
+        combined_text = f"{raw_text}\n{processed_text}"
+        
+        # Padrões específicos mais agressivos
+        for regex in _AGGRESSIVE_AMOUNT_PATTERNS:
+            for match in regex.findall(combined_text):
+                if isinstance(match, tuple):
+                    match = match[0]
                 
-                for pattern in number_patterns:
-                    matches = re.findall(pattern, combined_text)
-                    for match in matches:
-                        # Verifica se o número faz sentido como valor monetário
-                        clean_match = match.replace(',', '.').replace('.', ',')  # Normaliza para formato BR
-                        try:
-                            # Converte para float para validar
-                            float_val = float(clean_match.replace(',', '.'))
-                            # Se está em uma faixa razoável para transações (R$ 0,01 a R$ 9999,99)
-                            if 0.01 <= float_val <= 9999.99:
-                                normalized = self._normalize_amount(f'R$ {clean_match}')
-                                if normalized and normalized not in all_amounts:
-                                    all_amounts.append(normalized)
-                        except (ValueError, AttributeError):
-                            continue
+                # Tenta normalizar o valor encontrado
+                normalized = self._normalize_amount('R$ ' + str(match).strip())
+                if normalized:
+                    return normalized
+        
+        # Se ainda não encontrou, procura padrões extremamente flexíveis
+        # Busca sequências numéricas que possam ser valores
+        for regex in _NUMBER_PATTERNS:
+            for match in regex.findall(combined_text):
+                # Verifica se o número faz sentido como valor monetário
+                clean_match = match.replace(',', '.').replace('.', ',')  # Normaliza para formato BR
+                try:
+                    # Converte para float para validar
+                    float_val = float(clean_match.replace(',', '.'))
+                    # Se está em uma faixa razoável para transações (R$ 0,01 a R$ 9999,99)
+                    if 0.01 <= float_val <= 9999.99:
+                        normalized = self._normalize_amount(f'R$ {clean_match}')
+                        if normalized:
+                            return normalized
+                except (ValueError, AttributeError):
+                    continue
         
-        # Retorna o primeiro valor válido encontrado
-        return all_amounts[0] if all_amounts else None
+        return None
     
     def clean_and_process_text(self, raw_text):
         """Limpa e processa o texto extraído preservando valores monetários"""
@@ -573,27 +1166,30 @@ class StructuredTransactionOCR:
         protected_text = protected_text.replace('RS', 'R$')  # RS -> R$
         protected_text = protected_text.replace('R8', 'R$')  # R8 -> R$
         protected_text = protected_text.replace('R§', 'R$')  # R§ -> R$
-        protected_text = re.sub(r'R\s*\$', 'R$', protected_text)  # R $ -> R$
+        protected_text = _SPLIT_RS_PATTERN.sub('R$', protected_text)  # R $ -> R$
         
         # Remove caracteres estranhos mas preserva monetários
         # Mantém: letras, números, espaços, pontuação monetária, acentos
-        cleaned = re.sub(r'[^\w\s\.,\-\+\$R\(\)\/:\°áàâãéèêíìîóòôõúùûüçÁÀÂÃÉÈÊÍÌÎÓÒÔÕÚÙÛÜÇ]', ' ', protected_text)
-        
-        # Normaliza múltiplos espaços
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = _OCR_NOISE_PATTERN.sub(' ', protected_text)
         
-        # Remove espaços extras
-        cleaned = cleaned.strip()
+        # Normaliza múltiplos espaços e remove os das pontas (split sem argumento
+        # usa os mesmos espaços Unicode que \s, sem passar pelo motor de regex)
+        cleaned = ' '.join(cleaned.split())
         
         return cleaned
     
-    def process_single_quadrant(self, quadrant_num, image_path):
+    def process_single_quadrant(self, quadrant_num, image_path, baseline_text=None):
         """Processa um único quadrante"""
         print(f"    📋 Processando quadrante {quadrant_num:02d}...")
         
         try:
-            # Extrai texto com confiança
-            raw_text, confidence = self.ocr_engine.extract_text_with_confidence(str(image_path))
+            if baseline_text and self.extract_amounts(baseline_text):
+                # A leitura rápida já trouxe um valor: dispensa o OCR completo
+                # (confiança estimada para uma única fonte, como em extract_text_with_confidence)
+                raw_text, confidence = baseline_text, 40.0
+            else:
+                # Extrai texto com confiança
+                raw_text, confidence = self.ocr_engine.extract_text_with_confidence(str(image_path))
             
             # Processa o texto
             processed_text = self.clean_and_process_text(raw_text)
@@ -616,8 +1212,7 @@ class StructuredTransactionOCR:
                 processed_text=processed_text,
                 confidence=confidence,
                 timestamp=date_info,
-                amount=amount_found,
-                description=processed_text[:200] + "..." if len(processed_text) > 200 else processed_text
+                amount=amount_found
             )
             
             # Debug: mostra se encontrou valor
@@ -630,7 +1225,7 @@ class StructuredTransactionOCR:
                 print(f"       🔧 Texto processado: '{processed_text[:100]}{'...' if len(processed_text) > 100 else ''}'")
                 
                 # Tenta buscar qualquer sequência que pareça um valor
-                potential_values = re.findall(r'\d{1,3}[.,]\d{2}', raw_text + ' ' + processed_text)
+                potential_values = _NUMBER_PATTERNS[0].findall(raw_text + ' ' + processed_text)
                 if potential_values:
                     print(f"       🔍 Possíveis valores detectados: {potential_values}")
             
@@ -675,13 +1270,27 @@ class StructuredTransactionOCR:
         print(f"      Confiança: {header_confidence:.1f}%")
         
         # Processa demais quadrantes (transações)
-        transactions = []
+        transaction_images = quadrant_images[1:]  # Pula o primeiro
+        
+        baseline_texts = []
+        if self.batch_baseline:
+            print(f"   ⚡ Leitura rápida em lote de {len(transaction_images)} quadrantes...")
+            baseline_texts = self.ocr_engine.batch_extract([path for _, path in transaction_images])
+        
+        quadrant_numbers = [quadrant_num for quadrant_num, _ in transaction_images]
+        image_paths = [image_path for _, image_path in transaction_images]
+        baselines = baseline_texts or [None] * len(transaction_images)
+        
+        if self.quadrant_workers > 1 and len(transaction_images) > 1:
+            # Os quadrantes são independentes e o Tesseract libera o GIL;
+            # map devolve os resultados na ordem original dos quadrantes
+            with ThreadPoolExecutor(max_workers=min(self.quadrant_workers, len(transaction_images))) as executor:
+                results = list(executor.map(self.process_single_quadrant, quadrant_numbers, image_paths, baselines))
+        else:
+            results = map(self.process_single_quadrant, quadrant_numbers, image_paths, baselines)
         
-        for quadrant_num, image_path in quadrant_images[1:]:  # Pula o primeiro
-            transaction = self.process_single_quadrant(quadrant_num, image_path)
-            # Apenas adiciona transações válidas (pula None - quadrantes vazios)
-            if transaction is not None:
-                transactions.append(transaction)
+        # Apenas adiciona transações válidas (pula None - quadrantes vazios)
+        transactions = [transaction for transaction in results if transaction is not None]
         
         # Cria objeto do dia
         day_data = DayData(
@@ -715,43 +1324,102 @@ class StructuredTransactionOCR:
         if format == 'json':
             output_file = self.output_folder / f"{file_prefix}_data.json"
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(day_data), f, ensure_ascii=False, indent=2)
+            with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(_dumps_json(day_data, self.pretty_json))
             
             print(f"   💾 Dados salvos em: {output_file}")
         
         elif format == 'txt':
             output_file = self.output_folder / f"{file_prefix}_data.txt"
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"=== {day_data.day_folder.upper()} ===\n")
-                f.write(f"Data: {day_data.date_info}\n")
-                f.write(f"Processado em: {day_data.processing_timestamp}\n")
-                f.write(f"Total de quadrantes: {day_data.total_quadrants}\n\n")
-                
-                f.write("CABEÇALHO DO DIA:\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"{day_data.header_text}\n\n")
-                
-                f.write("TRANSAÇÕES:\n")
-                f.write("-" * 40 + "\n")
-                
-                for i, transaction in enumerate(day_data.transactions, 1):
-                    f.write(f"\nTransação {i} (Quadrante {transaction.quadrant_number}):\n")
-                    f.write(f"Confiança: {transaction.confidence:.1f}%\n")
-                    if transaction.amount:
-                        f.write(f"Valor: {transaction.amount}\n")
-                    if transaction.timestamp:
-                        f.write(f"Timestamp: {transaction.timestamp}\n")
-                    f.write(f"Texto:\n{transaction.processed_text}\n")
-                    f.write("-" * 20 + "\n")
+            # Monta o relatório inteiro em memória e grava com uma única escrita
+            parts = []
+            write = parts.append
+            write(f"=== {day_data.day_folder.upper()} ===\n")
+            write(f"Data: {day_data.date_info}\n")
+            write(f"Processado em: {day_data.processing_timestamp}\n")
+            write(f"Total de quadrantes: {day_data.total_quadrants}\n\n")
+            
+            write("CABEÇALHO DO DIA:\n")
+            write("-" * 40 + "\n")
+            write(f"{day_data.header_text}\n\n")
+            
+            write("TRANSAÇÕES:\n")
+            write("-" * 40 + "\n")
+            
+            # Um único bloco formatado por transação
+            separator = "-" * 20
+            for i, transaction in enumerate(day_data.transactions, 1):
+                amount_line = f"Valor: {transaction.amount}\n" if transaction.amount else ""
+                timestamp_line = f"Timestamp: {transaction.timestamp}\n" if transaction.timestamp else ""
+                write(
+                    f"\nTransação {i} (Quadrante {transaction.quadrant_number}):\n"
+                    f"Confiança: {transaction.confidence:.1f}%\n"
+                    f"{amount_line}{timestamp_line}"
+                    f"Texto:\n{transaction.processed_text}\n"
+                    f"{separator}\n"
+                )
+            
+            output_file.write_text("".join(parts), encoding='utf-8')
             
             print(f"   📄 Relatório salvo em: {output_file}")
         
         return output_file
     
-    def process_all_days(self, save_format='both'):
-        """Processa todos os dias disponíveis"""
+    def _process_day_safely(self, day_folder):
+        """Processa um dia, registrando o erro em vez de propagá-lo"""
+        try:
+            return self.process_single_day(day_folder)
+        except Exception as e:
+            print(f"❌ Erro ao processar {day_folder.name}: {str(e)}")
+            return None
+    
+    def _iter_processed_days(self, day_folders, max_workers):
+        """Gera (índice da pasta a partir de 1, dados do dia), em paralelo quando possível
+        
+        No modo paralelo os dias chegam na ordem em que terminam, para que cada um
+        seja salvo sem esperar os anteriores.
+        """
+        if max_workers <= 1 or len(day_folders) <= 1:
+            for index, day_folder in enumerate(day_folders, 1):
+                yield index, self._process_day_safely(day_folder)
+            return
+        
+        # Dias são independentes: cada processo recebe uma cópia deste processador
+        # (mesma classe, configurações e motor de OCR), e as threads de OCR são
+        # divididas entre os processos para não disputar núcleos
+        ocr_workers = max(1, (os.cpu_count() or 1) // max_workers)
+        initargs = (pytesseract.pytesseract.tesseract_cmd, self, ocr_workers)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_day_worker,
+                                 initargs=initargs) as executor:
+            futures = {executor.submit(_process_day_worker, day_folder): index
+                       for index, day_folder in enumerate(day_folders, 1)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    day_data = future.result()
+                except Exception as e:
+                    # Erros do próprio dia já são tratados no processo de trabalho; aqui chegam
+                    # falhas do processo em si (crash no Tesseract, falta de memória, resultado
+                    # que não pôde ser serializado): o dia conta como falho e os demais seguem
+                    print(f"❌ Erro ao processar {day_folders[index - 1].name}: {str(e)}")
+                    day_data = None
+                yield index, day_data
+    
+    def _save_day(self, day_data, save_format, index):
+        """Salva os formatos pedidos de um dia"""
+        if save_format in ['json', 'both']:
+            self.save_day_data(day_data, 'json', index)
+        
+        if save_format in ['txt', 'both']:
+            self.save_day_data(day_data, 'txt', index)
+    
+    def process_all_days(self, save_format='both', max_workers=None, background_io=True):
+        """Processa todos os dias disponíveis
+        
+        max_workers: processos para os dias (None = um a cada 4 núcleos; 1 = sequencial)
+        background_io: grava os arquivos de cada dia em threads enquanto o próximo é processado
+        """
         print("🚀 Iniciando processamento estruturado de OCR")
         print("=" * 60)
         
@@ -772,30 +1440,52 @@ class StructuredTransactionOCR:
         
         print(f"📁 Encontradas {len(day_folders)} pastas de dias para processar")
         
-        all_days_data = []
+        if max_workers is None:
+            # O Tesseract aproveita bem ~4 núcleos por processo
+            max_workers = max(1, (os.cpu_count() or 1) // 4)
+        
+        indexed_days = []
         successful_days = 0
         
-        for index, day_folder in enumerate(day_folders, 1):
+        # As gravações em segundo plano deixam o disco fora do caminho do OCR
+        io_pool = ThreadPoolExecutor(max_workers=4) if background_io else None
+        pending_saves = []
+        
+        for index, day_data in self._iter_processed_days(day_folders, max_workers):
+            day_folder = day_folders[index - 1]
             try:
-                day_data = self.process_single_day(day_folder)
-                
                 if day_data:
-                    all_days_data.append(day_data)
+                    indexed_days.append((index, day_data))
                     successful_days += 1
                     
                     # Salva dados do dia com índice sequencial
-                    if save_format in ['json', 'both']:
-                        self.save_day_data(day_data, 'json', index)
-                    
-                    if save_format in ['txt', 'both']:
-                        self.save_day_data(day_data, 'txt', index)
+                    if io_pool is not None:
+                        future = io_pool.submit(self._save_day, day_data, save_format, index)
+                        pending_saves.append((day_folder, future))
+                    else:
+                        self._save_day(day_data, save_format, index)
                 
             except Exception as e:
                 print(f"❌ Erro ao processar {day_folder.name}: {str(e)}")
         
+        if io_pool is not None:
+            # Aguarda todas as gravações antes do resumo
+            io_pool.shutdown(wait=True)
+            for day_folder, future in pending_saves:
+                error = future.exception()
+                if error is not None:
+                    print(f"❌ Erro ao processar {day_folder.name}: {str(error)}")
+        
+        # Resumo e retorno seguem a ordem das pastas, não a de término
+        all_days_data = [day_data for _, day_data in sorted(indexed_days, key=lambda item: item[0])]
+        
         # Salva resumo geral
         self.save_summary_report(all_days_data)
         
+        if _TESS_POOL is not None:
+            # Fim do OCR: libera os modelos de idioma carregados
+            _TESS_POOL.close()
+        
         print("\n" + "=" * 60)
         print("🎉 Processamento concluído!")
         print(f"✅ {successful_days} dias processados com sucesso")
@@ -809,32 +1499,60 @@ class StructuredTransactionOCR:
         summary_prefix = self._generate_file_prefix()
         summary_file = self.output_folder / f"{summary_prefix}_resumo_geral.txt"
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write("RELATÓRIO RESUMO - TRANSAÇÕES POR DIA\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Gerado em: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
-            f.write(f"Total de dias processados: {len(all_days_data)}\n\n")
+        lines = [
+            "RELATÓRIO RESUMO - TRANSAÇÕES POR DIA\n",
+            "=" * 50 + "\n",
+            f"Gerado em: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n",
+            f"Total de dias processados: {len(all_days_data)}\n\n",
+        ]
+        
+        for day_data in all_days_data:
+            # Confiança média
+            confidences = [t.confidence for t in day_data.transactions if t.confidence > 0]
+            avg_conf = statistics.fmean(confidences) if confidences else 0.0
             
-            for day_data in all_days_data:
-                f.write(f"📅 {day_data.day_folder} - {day_data.date_info}\n")
-                f.write(f"   Transações: {len(day_data.transactions)}\n")
-                f.write(f"   Quadrantes: {day_data.total_quadrants}\n")
-                
-                # Confiança média
-                confidences = [t.confidence for t in day_data.transactions if t.confidence > 0]
-                avg_conf = sum(confidences) / len(confidences) if confidences else 0
-                f.write(f"   Confiança média: {avg_conf:.1f}%\n")
-                
-                # Valores encontrados
-                amounts = [t.amount for t in day_data.transactions if t.amount]
-                if amounts:
-                    f.write(f"   Valores encontrados: {len(amounts)}\n")
-                
-                f.write("\n")
+            lines.extend([
+                f"📅 {day_data.day_folder} - {day_data.date_info}\n",
+                f"   Transações: {len(day_data.transactions)}\n",
+                f"   Quadrantes: {day_data.total_quadrants}\n",
+                f"   Confiança média: {avg_conf:.1f}%\n",
+            ])
+            
+            # Valores encontrados
+            amounts = [t.amount for t in day_data.transactions if t.amount]
+            if amounts:
+                lines.append(f"   Valores encontrados: {len(amounts)}\n")
+            
+            lines.append("\n")
+        
+        # Uma única passada de escrita/codificação para o relatório inteiro
+        with open(summary_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(lines)
         
         print(f"📊 Resumo geral salvo em: {summary_file}")
 
 
+# Processador de cada processo de trabalho de process_all_days
+_day_worker_processor = None
+
+def _init_day_worker(tesseract_cmd, processor, ocr_workers):
+    """Inicializa um processo de trabalho com o Tesseract e o processador do processo principal"""
+    global _day_worker_processor, _TESS_POOL
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    _day_worker_processor = processor
+    _day_worker_processor.ocr_engine.max_workers = ocr_workers
+    if _TESS_POOL is not None:
+        # Pool próprio do processo (o herdado pelo fork pode ter a trava ocupada),
+        # limitado às threads de OCR que este processo usa
+        _TESS_POOL = _TessPool(ocr_workers)
+    # Os núcleos já estão divididos entre os processos: quadrantes em sequência
+    _day_worker_processor.quadrant_workers = 1
+
+def _process_day_worker(day_folder):
+    """Processa um dia em um processo de trabalho"""
+    return _day_worker_processor._process_day_safely(day_folder)
+
+
 # Funções de conveniência
 def process_transactions_quick(base_folder, output_folder=None, save_format='both'):
     """Função rápida para processar transações"""
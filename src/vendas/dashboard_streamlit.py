@@ -14,8 +14,21 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 from datetime import datetime
+import json
 import os
 
+try:
+    import pyarrow  # Opcional: cache em Parquet dos dados já processados
+    import pyarrow.parquet as pq
+except ImportError:
+    pyarrow = None
+    pq = None
+
+# Versão do formato do cache Parquet: incrementar ao mudar as colunas geradas
+_VERSAO_CACHE = 1
+# Chave dos metadados Parquet com a assinatura das fontes do cache
+_CHAVE_ASSINATURA = b'vendas_cache'
+
 # Configuração da página
 st.set_page_config(
     page_title="Dashboard Pastelaria Vinny",
@@ -51,6 +64,43 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def _assinatura_fontes(caminhos_csv):
+    """Assinatura das fontes do cache: versão + (caminho, modificação, tamanho) de cada CSV
+    
+    Inclui o próprio dashboard, para que mudanças no processamento (limpeza de
+    valores, filtros, colunas derivadas) também invalidem o cache.
+    """
+    fontes = []
+    for caminho in [os.path.abspath(__file__)] + sorted(caminhos_csv):
+        info = os.stat(caminho)
+        fontes.append([caminho, info.st_mtime_ns, info.st_size])
+    return json.dumps({'versao': _VERSAO_CACHE, 'fontes': fontes}).encode('utf-8')
+
+def _carregar_cache(caminho_cache, assinatura):
+    """DataFrame em cache se a assinatura gravada for idêntica à atual, senão None"""
+    try:
+        tabela = pq.read_table(caminho_cache)
+    except Exception:
+        return None  # Cache inexistente ou ilegível: refaz a partir dos CSVs
+    metadados = tabela.schema.metadata or {}
+    if metadados.get(_CHAVE_ASSINATURA) != assinatura:
+        return None
+    return tabela.to_pandas()
+
+def _salvar_cache(df, caminho_cache, assinatura):
+    """Grava o cache Parquet de forma atômica (o cache é opcional: falhas são ignoradas)"""
+    caminho_temp = caminho_cache + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(caminho_cache), exist_ok=True)
+        tabela = pyarrow.Table.from_pandas(df)
+        tabela = tabela.replace_schema_metadata({**(tabela.schema.metadata or {}),
+                                                 _CHAVE_ASSINATURA: assinatura})
+        pq.write_table(tabela, caminho_temp, compression='snappy')
+        os.replace(caminho_temp, caminho_cache)
+    except Exception:
+        if os.path.exists(caminho_temp):
+            os.remove(caminho_temp)
+
 @st.cache_data
 def carregar_dados():
     """Carrega e processa os dados de vendas multi-mensal"""
@@ -84,25 +134,26 @@ def carregar_dados():
             else:
                 return 'Madrugada'
         
-        def carregar_dados_mes(mes, caminho_base):
-            """Carrega dados de um mês específico"""
-            dados_mes = {'pix': pd.DataFrame(), 'credito': pd.DataFrame(), 'debito': pd.DataFrame()}
-            
-            # Mapeamento de arquivos por método
+        def arquivos_do_mes(mes):
+            """Mapeamento de arquivos CSV por método de pagamento"""
             if mes == 'setembro':
-                arquivos = {
+                return {
                     'pix': 'transacoes_pix.csv',
                     'credito': 'transacoes_credito.csv', 
                     'debito': 'transacoes_debito.csv'
                 }
-            else:  # Para agosto e outros meses
-                arquivos = {
-                    'pix': 'pix/transacoes_consolidadas.csv',
-                    'credito': 'credito/transacoes_consolidadas.csv', 
-                    'debito': 'debito/transacoes_consolidadas.csv'
-                }
+            # Para agosto e outros meses
+            return {
+                'pix': 'pix/transacoes_consolidadas.csv',
+                'credito': 'credito/transacoes_consolidadas.csv', 
+                'debito': 'debito/transacoes_consolidadas.csv'
+            }
+        
+        def carregar_dados_mes(mes, caminho_base):
+            """Carrega dados de um mês específico"""
+            dados_mes = {'pix': pd.DataFrame(), 'credito': pd.DataFrame(), 'debito': pd.DataFrame()}
             
-            for metodo, arquivo in arquivos.items():
+            for metodo, arquivo in arquivos_do_mes(mes).items():
                 caminho_arquivo = os.path.join(caminho_base, arquivo)
                 if os.path.exists(caminho_arquivo):
                     try:
@@ -153,6 +204,22 @@ def carregar_dados():
             
             return df_clean
         
+        # Cache Parquet: dados já limpos e enriquecidos, dispensa a leitura e o
+        # processamento dos CSVs enquanto o conjunto de arquivos não mudar
+        caminho_cache = os.path.join(base_path, 'outputs', 'cache', 'vendas.parquet')
+        caminhos_csv = [
+            os.path.join(caminho, arquivo)
+            for mes, caminho in meses_disponiveis.items()
+            for arquivo in arquivos_do_mes(mes).values()
+        ]
+        caminhos_csv = [caminho for caminho in caminhos_csv if os.path.exists(caminho)]
+        
+        assinatura = _assinatura_fontes(caminhos_csv) if pyarrow is not None and caminhos_csv else None
+        if assinatura is not None:
+            df_cache = _carregar_cache(caminho_cache, assinatura)
+            if df_cache is not None:
+                return df_cache
+        
         # Carregar e processar todos os meses
         todos_dados = []
         
@@ -174,6 +241,8 @@ def carregar_dados():
         if todos_dados:
             df_completo = pd.concat(todos_dados, ignore_index=True)
             df_completo = df_completo.dropna(subset=['DateTime'])
+            if assinatura is not None:
+                _salvar_cache(df_completo, caminho_cache, assinatura)
             return df_completo
         else:
             st.error("Nenhum dado encontrado nos meses disponíveis")
@@ -0,0 +1,55 @@
+import pickle
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "ocr"))
+
+# Sem Tesseract instalado o módulo pede o caminho manualmente ao ser importado
+with mock.patch("builtins.input", return_value=""):
+    import structured_ocr
+
+
+class _CustomProcessor(structured_ocr.StructuredTransactionOCR):
+    """Subclasse com um método sobrescrito, como um chamador faria"""
+
+    def clean_and_process_text(self, raw_text):
+        return raw_text.upper()
+
+
+def _init_worker_as_spawned(processor, ocr_workers):
+    """Inicializa o processo de trabalho como no método 'spawn': argumentos via pickle"""
+    initargs = (structured_ocr.pytesseract.pytesseract.tesseract_cmd, processor, ocr_workers)
+    structured_ocr._init_day_worker(*pickle.loads(pickle.dumps(initargs)))
+    return structured_ocr._day_worker_processor
+
+
+def test_day_worker_receives_parent_engine_settings(tmp_path):
+    """Configurações do motor de OCR ajustadas no processo principal chegam aos processos de dias"""
+    processor = structured_ocr.StructuredTransactionOCR(tmp_path / "setembro" / "pix", tmp_path / "saida")
+    processor.ocr_engine.single_pass = True
+    processor.ocr_engine.binarization = 'otsu'
+    processor.ocr_engine.max_width = 1200
+
+    engine = _init_worker_as_spawned(processor, 3).ocr_engine
+
+    assert engine.single_pass is True
+    assert engine.binarization == 'otsu'
+    assert engine.max_width == 1200
+    assert engine.max_workers == 3
+
+
+def test_day_worker_keeps_parent_processor_state(tmp_path):
+    """Subclasses e atributos ajustados após a construção valem também no modo paralelo"""
+    processor = _CustomProcessor(tmp_path / "setembro" / "pix", tmp_path / "saida")
+    processor.pretty_json = True
+    processor.batch_baseline = True
+
+    worker = _init_worker_as_spawned(processor, 2)
+
+    assert type(worker) is _CustomProcessor
+    assert worker.clean_and_process_text("pix") == "PIX"
+    assert worker.pretty_json is True
+    assert worker.batch_baseline is True
+    assert worker.output_folder == processor.output_folder
+    assert worker.quadrant_workers == 1